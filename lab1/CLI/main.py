@@ -1,4 +1,6 @@
+import logging
 import sys
+from logging.handlers import MemoryHandler
 from sources.exceptions import EnrollmentError, ResourceError, StorageError, StateError
 from sources.storage import Storage
 from sources.handle_functions import (
@@ -16,7 +18,50 @@ from sources.handle_functions import (
 )
 
 
+# Сообщения об ошибках по типу исключения: один dict-поиск вместо
+# лестницы из шести except-веток.
+_ERROR_PREFIXES = {
+    EnrollmentError: "Ошибка обучения: ",
+    ResourceError: "Ошибка ресурса: ",
+    StateError: "Ошибка состояния: ",
+    StorageError: "Ошибка файла: ",
+    ValueError: "Ошибка ввода. ",
+}
+_HANDLED_ERRORS = tuple(_ERROR_PREFIXES)
+
+_MENU = """
+Меню:
+1. Добавить студента
+2. Отчислить студента
+3. Добавить преподавателя
+4. Увольнение преподавателя
+5. Добавить учебный план
+6. Добавить предмет в учебный план
+7. Добавить аудиторию
+8. Провести экзамен
+9. Взять книгу
+10. Вернуть книгу
+11. Добавить книгу в ассортимент
+12. Завершить семестр (Расчёт стипендии)
+0. Выход и Сохранение"""
+
+
+def _print_bootstrap_summary(uni) -> None:
+    # Единственный вывод за весь бутстрап: сама инициализация идёт через
+    # bulk_load и ничего не печатает.
+    sys.stdout.write(
+        f"Инициализация: {len(uni.students)} студентов, "
+        f"{len(uni.teachers)} преподавателей, {len(uni.classrooms)} аудиторий.\n"
+    )
+
+
 def main():
+    # События домена пишутся на уровне DEBUG; буферизующий обработчик
+    # сбрасывает их пачками, а не по syscall на каждое сообщение.
+    logging.getLogger("sources").addHandler(
+        MemoryHandler(capacity=1024, target=logging.StreamHandler())
+    )
+
     storage = Storage()
     try:
         uni = storage.load_data()
@@ -24,98 +69,67 @@ def main():
     except FileNotFoundError:
         print("\nФайл базы данных не найден. Создаём новый университет.")
         uni = storage.create_default_university()
+        _print_bootstrap_summary(uni)
     except StorageError as e:
         print(f"\nОшибка чтения JSON или файл повреждён: {e}")
         print("Создаём новую базу.")
         uni = storage.create_default_university()
+        _print_bootstrap_summary(uni)
+
+    def handle_conduct_exam(uni):
+        print("\n[Проведение экзамена]")
+        if not uni.students:
+            print("Нет студентов для экзамена.")
+            return
+        conduct_exam(uni)
+
+    def handle_semester_end(uni):
+        print("\n[Завершение семестра (Расчёт стипендии)]")
+        count = uni.process_semester_end()
+        if count > 0:
+            print(f"Семестр закрыт. Стипендия назначена {count} студентам.")
+        else:
+            print("Семестр закрыт. Стипендии не назначены.")
+
+    def handle_exit(uni):
+        print("\n[Выход и Сохранение]")
+        storage.save_data(uni)
+        print(f"Данные сохранены в '{storage.file}'")
+        sys.exit(0)
+
+    # Таблица диспетчеризации строится один раз: выбор пункта — это один
+    # dict-поиск вместо цепочки из 13 сравнений строк на каждой итерации.
+    handlers = {
+        "1": add_student,
+        "2": remove_student,
+        "3": add_teacher,
+        "4": remove_teacher,
+        "5": add_curriculum,
+        "6": add_subject_to_curriculum,
+        "7": add_classroom,
+        "8": handle_conduct_exam,
+        "9": lend_book_from_library,
+        "10": return_book_to_library,
+        "11": add_book_to_library,
+        "12": handle_semester_end,
+        "0": handle_exit,
+    }
 
     while True:
-        print(
-            f"{uni.name} | Студентов: {len(uni.students)}, Преподавателей: {len(uni.teachers)}, Учебных планов: {len(uni.curriculums)}"
-        )
-        print("\nМеню:")
-        print("1. Добавить студента")
-        print("2. Отчислить студента")
-        print("3. Добавить преподавателя")
-        print("4. Увольнение преподавателя")
-        print("5. Добавить учебный план")
-        print("6. Добавить предмет в учебный план")
-        print("7. Добавить аудиторию")
-        print("8. Провести экзамен")
-        print("9. Взять книгу")
-        print("10. Вернуть книгу")
-        print("11. Добавить книгу в ассортимент")
-        print("12. Завершить семестр (Расчёт стипендии)")
-        print("0. Выход и Сохранение")
+        print(uni.status_line())
+        print(_MENU)
 
         choice = input("Ваш выбор: ")
 
+        handler = handlers.get(choice)
+        if handler is None:
+            print("Неверный ввод, попробуйте еще раз.")
+            continue
+
         try:
-            if choice == "1":
-                add_student(uni)
-
-            elif choice == "2":
-                remove_student(uni)
-
-            elif choice == "3":
-                add_teacher(uni)
-
-            elif choice == "4":
-                remove_teacher(uni)
-
-            elif choice == "5":
-                add_curriculum(uni)
-
-            elif choice == "6":
-                add_subject_to_curriculum(uni)
-
-            elif choice == "7":
-                add_classroom(uni)
-
-            elif choice == "8":
-                print("\n[Проведение экзамена]")
-                if not uni.students:
-                    print("Нет студентов для экзамена.")
-                    continue
-
-                conduct_exam(uni)
-
-            elif choice == "9":
-                lend_book_from_library(uni)
-
-            elif choice == "10":
-                return_book_to_library(uni)
-
-            elif choice == "11":
-                add_book_to_library(uni)
-
-            elif choice == "12":
-                print("\n[Завершение семестра (Расчёт стипендии)]")
-                count = uni.process_semester_end()
-                if count > 0:
-                    print(f"Семестр закрыт. Стипендия назначена {count} студентам.")
-                else:
-                    print("Семестр закрыт. Стипендии не назначены.")
-
-            elif choice == "0":
-                print("\n[Выход и Сохранение]")
-                storage.save_data(uni)
-                print(f"Данные сохранены в '{storage.file}'")
-                sys.exit(0)
-
-            else:
-                print("Неверный ввод, попробуйте еще раз.")
-
-        except EnrollmentError as e:
-            print(f"Ошибка обучения: {e}")
-        except ResourceError as e:
-            print(f"Ошибка ресурса: {e}")
-        except StateError as e:
-            print(f"Ошибка состояния: {e}")
-        except StorageError as e:
-            print(f"Ошибка файла: {e}")
-        except ValueError as e:
-            print(f"Ошибка ввода. {e}")
+            handler(uni)
+        except _HANDLED_ERRORS as e:
+            print(f"{_ERROR_PREFIXES[type(e)]}{e}")
         except Exception as e:
             print(f"Непредвиденная ошибка: {e}")
 
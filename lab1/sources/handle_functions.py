@@ -3,6 +3,17 @@ from sources.university import University
 from sources.exceptions import EnrollmentError, StateError
 
 
+def _select_person(people, query: str):
+    """Умный поиск: точное совпадение без учёта регистра, иначе —
+    однозначное совпадение по части имени."""
+    q = query.casefold()
+    exact = next((p for p in people if p.full_name_casefold == q), None)
+    if exact:
+        return exact
+    matches = [p for p in people if q in p.full_name_casefold]
+    return matches[0] if len(matches) == 1 else None
+
+
 def _get_int(text: str, min_value: int, max_value: int) -> int:
     while True:
         try:
@@ -29,7 +40,7 @@ def add_student(uni: University) -> None:
 def remove_student(uni: University) -> None:
     print("\n[Отчисление студента]")
     name = input("Введите ФИО студента: ").strip()
-    student = next((s for s in uni.students if s.full_name == name), None)
+    student = _select_person(uni.students, name)
     if student:
         uni.expel_student(student)
         print(f"Студент {student.full_name} отчислен.")
@@ -56,7 +67,7 @@ def add_teacher(uni: University) -> None:
 def remove_teacher(uni: University) -> None:
     print("\n[Увольнение преподавателя]")
     name = input("Введите ФИО преподавателя: ").strip()
-    teacher = next((t for t in uni.teachers if t.full_name == name), None)
+    teacher = _select_person(uni.teachers, name)
     if teacher:
         uni.fire_teacher(teacher)
         print(f"Преподаватель {teacher.full_name} уволен.")
@@ -93,17 +104,13 @@ def add_classroom(uni: University) -> None:
 
 def conduct_exam(uni: University) -> None:
     subject = input("Предмет: ")
-    teacher = next((t for t in uni.teachers if subject in t.subjects), None)
+    teacher = uni.find_teacher_for(subject)
     if not teacher:
         raise EnrollmentError(f"Нет преподавателя по предмету '{subject}'!")
-    classroom = next((c for c in uni.classrooms if not c.is_occupied), None)
+    classroom = uni.find_free_classroom()
     if not classroom:
         raise StateError("Все аудитории заняты!")
-    students = [
-        s
-        for s in uni.students
-        if s.curriculum and subject in s.curriculum.required_subjects
-    ]
+    students = uni.find_students_for(subject)
     if not students:
         raise EnrollmentError(
             f"Нет студентов, у которых предмет '{subject}' есть в учебном плане."
@@ -117,8 +124,8 @@ def conduct_exam(uni: University) -> None:
     print("Экзамен завершён.")
     if students_to_expel:
         print(f"\nЗапуск процедуры отчисления для {len(students_to_expel)} студентов: ")
+        uni.expel_students(students_to_expel)
         for student in students_to_expel:
-            uni.expel_student(student)
             print(f"{student.full_name} отчислен (не сдал экзамен).")
     else:
         print("Все студенты успешно сдали экзамен.")
@@ -127,7 +134,7 @@ def conduct_exam(uni: University) -> None:
 def return_book_to_library(uni: University) -> None:
     print("\n[Возврат книги]")
     name = input("Введите ФИО студента: ").strip()
-    student = next((s for s in uni.students if s.full_name == name), None)
+    student = _select_person(uni.students, name)
     if student:
         title = input("Название книги: ")
         uni.library.accept_return(student, title)
@@ -139,7 +146,7 @@ def return_book_to_library(uni: University) -> None:
 def lend_book_from_library(uni: University) -> None:
     print("\n[Выдача книги]")
     name = input("Введите ФИО студента: ").strip()
-    student = next((s for s in uni.students if s.full_name == name), None)
+    student = _select_person(uni.students, name)
     if student:
         title = input("Название книги: ")
         uni.library.lend_book(student, title)
@@ -153,7 +160,7 @@ def add_book_to_library(uni: University) -> None:
     title = input("Название книги: ")
     author = input("Автор: ")
     quantity = _get_int("Количество экземпляров: ", 1, 1000)
-    existing_book = next((b for b in uni.library.inventory if b.title == title), None)
+    existing_book = uni.library.find_by_title(title)
     if existing_book:
         uni.library.add_book(existing_book, quantity)
         print(f"Добавлено {quantity} шт. к существующей книге '{existing_book.title}'.")
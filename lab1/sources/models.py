@@ -1,12 +1,35 @@
+import logging
+import sys
+import time
+from array import array
 from dataclasses import dataclass, field
-from abc import ABC
 from datetime import datetime
 from enum import Enum
+from heapq import nlargest
+from itertools import count
 from typing import Optional
-from random import randint
-from uuid import uuid4
+from random import choices
 from sources.exceptions import ResourceError
 
+logger = logging.getLogger(__name__)
+
+# Дешёвая замена uuid4: метка запуска процесса + монотонный счётчик.
+# Уникальность сохраняется и между сессиями за счёт метки времени.
+_RUN_TAG = format(time.time_ns(), "x")
+# Пул оценок для розыгрыша экзамена: строится один раз на импорт модуля,
+# а не по range-объекту на каждый экзамен.
+_GRADE_POOL = tuple(range(1, 11))
+_person_ids = count(1)
+_book_ids = count(1)
+
+
+def _next_person_id() -> str:
+    return f"{_RUN_TAG}-{next(_person_ids)}"
+
+
+def _next_isbn() -> str:
+    return f"{_RUN_TAG}-{next(_book_ids)}"
+
 
 class TeacherDegree(Enum):
     DOCTOR_OF_SCIENCES = "Доктор наук"
@@ -17,17 +40,38 @@ class TeacherDegree(Enum):
     LECTURER = "Преподаватель"
 
 
-@dataclass(frozen=True)
 class Book:
-    title: str
-    author: str
-    isbn: str = field(default_factory=lambda: str(uuid4()))
+    __slots__ = ("title", "author", "isbn", "_hash")
+
+    def __init__(self, title: str, author: str, isbn: Optional[str] = None) -> None:
+        self.title = title
+        self.author = author
+        self.isbn = isbn if isbn is not None else _next_isbn()
+        # ISBN уникален, поэтому хеш и равенство достаточно считать по нему;
+        # хеш кешируется один раз при создании.
+        self._hash = hash(self.isbn)
+
+    def __repr__(self) -> str:
+        return f"Book(title={self.title!r}, author={self.author!r}, isbn={self.isbn!r})"
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Book) and self.isbn == other.isbn
 
+    def __hash__(self) -> int:
+        return self._hash
 
-@dataclass
+
+@dataclass(slots=True)
 class Curriculum:
     _specialty_name: str
     _required_subjects: list[str] = field(default_factory=list)
+    _required_set: set[str] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Интернированные имена предметов разделяются всеми планами,
+        # преподавателями и зачётками вместо тысяч копий одинаковых строк.
+        self._required_subjects = [sys.intern(s) for s in self._required_subjects]
+        self._required_set = set(self._required_subjects)
 
     @property
     def specialty_name(self) -> str:
@@ -37,18 +81,53 @@ class Curriculum:
     def required_subjects(self) -> list[str]:
         return self._required_subjects
 
+    def requires(self, subject_name: str) -> bool:
+        return subject_name in self._required_set
+
     def add_subject(self, subject_name: str) -> None:
         if not subject_name.strip():
             raise ValueError("Название предмета не может быть пустым!")
-        if subject_name not in self._required_subjects:
+        subject_name = sys.intern(subject_name)
+        if subject_name not in self._required_set:
             self._required_subjects.append(subject_name)
+            self._required_set.add(subject_name)
+
+
+@dataclass(slots=True)
+class OccupancyBoard:
+    """Занятость аудиторий одним целым-битмапом: бит N — аудитория N."""
+
+    _occupied_bits: int = 0
+    _free_numbers: set[int] = field(default_factory=set)
+
+    def register(self, number: int) -> None:
+        if not self.is_occupied(number):
+            self._free_numbers.add(number)
+
+    def occupy(self, number: int) -> None:
+        self._occupied_bits |= 1 << number
+        self._free_numbers.discard(number)
+
+    def vacate(self, number: int) -> None:
+        self._occupied_bits &= ~(1 << number)
+        self._free_numbers.add(number)
 
+    def first_free(self) -> Optional[int]:
+        return next(iter(self._free_numbers), None)
 
-@dataclass
+    def is_occupied(self, number: int) -> bool:
+        return bool(self._occupied_bits >> number & 1)
+
+    @property
+    def occupied_count(self) -> int:
+        return self._occupied_bits.bit_count()
+
+
+@dataclass(slots=True)
 class Classroom:
     _number: int
     _capacity: int
-    _is_occupied: bool = False
+    _board: OccupancyBoard = field(default_factory=OccupancyBoard)
 
     @property
     def number(self) -> int:
@@ -60,29 +139,52 @@ class Classroom:
 
     @property
     def is_occupied(self) -> bool:
-        return self._is_occupied
+        return self._board.is_occupied(self._number)
 
     @is_occupied.setter
     def is_occupied(self, value: bool) -> None:
-        self._is_occupied = value
+        if value:
+            self._board.occupy(self._number)
+        else:
+            self._board.vacate(self._number)
+
+    def join_board(self, board: "OccupancyBoard") -> None:
+        """Переводит аудиторию на общий битмап (например, университета)."""
+        if self._board.is_occupied(self._number):
+            board.occupy(self._number)
+        else:
+            board.register(self._number)
+        self._board = board
 
     def occupy(self) -> None:
-        self._is_occupied = True
+        self._board.occupy(self._number)
+        logger.debug("Аудитория %d занята.", self._number)
 
     def vacate(self) -> None:
-        self._is_occupied = False
+        self._board.vacate(self._number)
+        logger.debug("Аудитория %d освобождена.", self._number)
 
 
-@dataclass
-class Person(ABC):
+@dataclass(slots=True)
+class Person:
     _full_name: str
     _age: int
-    _id: str = field(default_factory=lambda: str(uuid4()))
+    _id: str = field(default_factory=_next_person_id)
+    _name_cf: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Имя не меняется после создания, поэтому casefold-форму для поиска
+        # считаем один раз здесь, а не на каждый запрос.
+        self._name_cf = self._full_name.casefold()
 
     @property
     def full_name(self) -> str:
         return self._full_name
 
+    @property
+    def full_name_casefold(self) -> str:
+        return self._name_cf
+
     @property
     def age(self) -> int:
         return self._age
@@ -96,12 +198,24 @@ class Person(ABC):
         self._id = value
 
 
-@dataclass
 class Student(Person):
-    _curriculum: Optional[Curriculum] = None
-    _scholarship_amount: float = 0.0
-    _record_book: dict[str, int] = field(default_factory=dict)
-    _borrowed_books: list[Book] = field(default_factory=list)
+    __slots__ = (
+        "_curriculum",
+        "_scholarship_amount",
+        "_borrowed_books",
+        "_grades",
+        "_subject_to_idx",
+    )
+
+    def __init__(self, full_name: str, age: int) -> None:
+        super().__init__(full_name, age)
+        self._curriculum: Optional[Curriculum] = None
+        self._scholarship_amount = 0.0
+        self._borrowed_books: set[Book] = set()
+        # Зачётка хранится парой параллельных структур: компактный массив
+        # оценок (sum/len по нему идут C-циклом) и индекс предмет → позиция.
+        self._grades: array = array("b")
+        self._subject_to_idx: dict[str, int] = {}
 
     @property
     def curriculum(self) -> Optional[Curriculum]:
@@ -113,17 +227,22 @@ class Student(Person):
 
     @property
     def record_book(self) -> dict[str, int]:
-        return self._record_book
+        # Dict материализуется только на чтение (вывод/сериализация);
+        # горячие операции работают с массивом напрямую.
+        return {
+            subject: self._grades[idx]
+            for subject, idx in self._subject_to_idx.items()
+        }
 
     @property
-    def borrowed_books(self) -> list[Book]:
+    def borrowed_books(self) -> set[Book]:
         return self._borrowed_books
 
     @property
     def average_score(self) -> float:
-        if not self._record_book:
+        if not self._grades:
             return 0.0
-        return sum(self._record_book.values()) / len(self._record_book)
+        return sum(self._grades) / len(self._grades)
 
     @curriculum.setter
     def curriculum(self, curriculum: Optional[Curriculum]) -> None:
@@ -135,20 +254,30 @@ class Student(Person):
 
     @record_book.setter
     def record_book(self, record_book: dict[str, int]) -> None:
-        self._record_book = record_book
+        self._grades = array("b", record_book.values())
+        self._subject_to_idx = {
+            sys.intern(subject): idx
+            for idx, subject in enumerate(record_book)
+        }
 
     def assign_scholarship(self, amount: float) -> None:
         self._scholarship_amount = amount
 
     def take_exam(self, subject_name: str, grade: int) -> None:
-        self._record_book[subject_name] = grade
+        subject_name = sys.intern(subject_name)
+        idx = self._subject_to_idx.get(subject_name)
+        if idx is None:
+            self._subject_to_idx[subject_name] = len(self._grades)
+            self._grades.append(grade)
+        else:
+            self._grades[idx] = grade
 
     def borrow_book(self, book: Book) -> None:
         if book in self._borrowed_books:
             raise ResourceError(
                 f"У студента {self._full_name} уже есть книга '{book.title}'!"
             )
-        self._borrowed_books.append(book)
+        self._borrowed_books.add(book)
 
     def return_book(self, book: Book) -> None:
         if book in self._borrowed_books:
@@ -157,20 +286,26 @@ class Student(Person):
             raise ResourceError(f"Студент не брал книгу '{book.title}'!")
 
     def add_book(self, book: Book) -> None:
-        self._borrowed_books.append(book)
+        self._borrowed_books.add(book)
 
 
-@dataclass
+@dataclass(slots=True)
 class Teacher(Person):
     _degree: Optional[TeacherDegree] = None
-    _subjects: list[str] = field(default_factory=list)
+    _subjects: tuple[str, ...] = ()
+    _subjects_set: frozenset[str] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        Person.__post_init__(self)
+        self._subjects = tuple(sys.intern(s) for s in self._subjects)
+        self._subjects_set = frozenset(self._subjects)
 
     @property
     def degree(self) -> Optional[TeacherDegree]:
         return self._degree
 
     @property
-    def subjects(self) -> list[str]:
+    def subjects(self) -> tuple[str, ...]:
         return self._subjects
 
     @degree.setter
@@ -179,68 +314,122 @@ class Teacher(Person):
 
     @subjects.setter
     def subjects(self, subjects: list[str]) -> None:
-        self._subjects = subjects
+        # Кортеж — упорядоченное представление для вывода и сериализации,
+        # frozenset — O(1) проверка "ведёт ли предмет".
+        self._subjects = tuple(sys.intern(s) for s in subjects)
+        self._subjects_set = frozenset(self._subjects)
+
+    def has_subject(self, subject: str) -> bool:
+        return subject in self._subjects_set
 
     def evaluate_student(self, student: Student, subject: str, grade: int) -> None:
         student.take_exam(subject, grade)
 
+    def evaluate_students(
+        self, graded: list[tuple[Student, int]], subject: str
+    ) -> None:
+        for student, grade in graded:
+            student.take_exam(subject, grade)
+
 
-@dataclass
+def _compute_amounts(scores: array, min_score: float, base: float) -> array:
+    return array(
+        "d",
+        (
+            round(base * (1 + (score - min_score) * 0.1), 2)
+            if score >= min_score
+            else 0.0
+            for score in scores
+        ),
+    )
+
+
+@dataclass(slots=True)
 class ScholarshipDepartment:
     _min_average_score: float = 6.0
     _base_amount: float = 100.0
 
     def calculate_and_assign(self, students: list[Student]) -> int:
+        # Читаем слот напрямую, минуя дескриптор average_score: на большой
+        # когорте сбор баллов сам по себе становится горячим участком.
+        scores = array(
+            "d",
+            (
+                sum(s._grades) / len(s._grades) if s._grades else 0.0
+                for s in students
+            ),
+        )
+        amounts = _compute_amounts(scores, self._min_average_score, self._base_amount)
         count = 0
-        for student in students:
-            if student.average_score >= self._min_average_score:
-                bonus = (student.average_score - self._min_average_score) * 0.1
-                final_amount = round(self._base_amount * (1 + bonus), 2)
-                student.assign_scholarship(final_amount)
+        for student, amount in zip(students, amounts):
+            student._scholarship_amount = amount
+            if amount:
                 count += 1
-            else:
-                student.assign_scholarship(0.0)
         return count
 
+    def top_k(self, students: list[Student], k: int) -> list[Student]:
+        """Лучшие k студентов по среднему баллу за O(n log k), без полной
+        сортировки когорты."""
+        return nlargest(k, students, key=lambda student: student.average_score)
 
-@dataclass
+
+@dataclass(slots=True)
 class Library:
-    _inventory: dict[Book, int] = field(default_factory=dict)
+    # Каталог ключуется названием (casefold), значение — пара (книга,
+    # количество): каждая операция стоит одно хеширование строки вместо
+    # разрешения названия в Book и повторного пробинга по Book-ключу.
+    _inventory: dict[str, tuple[Book, int]] = field(default_factory=dict)
 
     @property
     def inventory(self) -> dict[Book, int]:
-        return self._inventory
+        # Внешнее представление (сериализация, вывод) материализуется
+        # только на чтение; горячие операции работают по строковому ключу.
+        return {book: quantity for book, quantity in self._inventory.values()}
 
     def add_book(self, book: Book, quantity: int) -> None:
-        if book in self._inventory:
-            self._inventory[book] += quantity
+        key = book.title.casefold()
+        entry = self._inventory.get(key)
+        if entry is None:
+            self._inventory[key] = (book, quantity)
         else:
-            self._inventory[book] = quantity
+            # Первый добавленный экземпляр названия остаётся каноническим.
+            canonical, count = entry
+            self._inventory[key] = (canonical, count + quantity)
+
+    def find_by_title(self, book_title: str) -> Optional[Book]:
+        entry = self._inventory.get(book_title.casefold())
+        return entry[0] if entry else None
 
     def lend_book(self, student: Student, book_title: str) -> None:
-        found_book = next((b for b in self._inventory if b.title == book_title), None)
-        if not found_book:
+        key = book_title.casefold()
+        entry = self._inventory.get(key)
+        if entry is None:
             raise ResourceError(f"Книга '{book_title}' не найдена в каталоге!")
-        if self._inventory[found_book] <= 0:
+        book, quantity = entry
+        if quantity <= 0:
             raise ResourceError(f"Все экземпляры '{book_title}' выданы!")
-        student.borrow_book(found_book)
-        self._inventory[found_book] -= 1
+        student.borrow_book(book)
+        self._inventory[key] = (book, quantity - 1)
+        logger.debug("Книга '%s' выдана студенту %s.", book_title, student.full_name)
 
     def accept_return(self, student: Student, book_title: str) -> None:
-        found_book = next((b for b in self._inventory if b.title == book_title), None)
-        if not found_book:
+        key = book_title.casefold()
+        entry = self._inventory.get(key)
+        if entry is None:
             raise ResourceError(f"Книга '{book_title}' не принадлежит этой библиотеке!")
-        student.return_book(found_book)
-        self._inventory[found_book] += 1
+        book, quantity = entry
+        student.return_book(book)
+        self._inventory[key] = (book, quantity + 1)
 
 
-@dataclass
+@dataclass(slots=True)
 class Exam:
     _subject: str
-    _date: datetime
+    _date_ns: int
     _teacher: Teacher
     _classroom: Classroom
     _registered_students: list[Student] = field(default_factory=list)
+    _date_cache: Optional[datetime] = field(init=False, repr=False, default=None)
 
     @property
     def subject(self) -> str:
@@ -248,7 +437,11 @@ class Exam:
 
     @property
     def date(self) -> datetime:
-        return self._date
+        # datetime материализуется лениво, только для отображения/сериализации;
+        # храним дату компактным целым (нс с эпохи), объект строим один раз.
+        if self._date_cache is None:
+            self._date_cache = datetime.fromtimestamp(self._date_ns / 1_000_000_000)
+        return self._date_cache
 
     @property
     def teacher(self) -> Teacher:
@@ -267,13 +460,18 @@ class Exam:
         self._registered_students = students
 
     def conduct(self) -> list[Student]:
+        logger.debug(
+            "Экзамен по %s: %d студентов.", self._subject, len(self._registered_students)
+        )
         self._classroom.occupy()
-        students_to_expel = []
-        for student in self._registered_students:
-            grade = randint(1, 10)
-            self._teacher.evaluate_student(student, self._subject, grade)
-            if grade < 4:
-                students_to_expel.append(student)
+        students = self._registered_students
+        # Предмет фиксирован на весь экзамен: интернируем один раз, чтобы
+        # каждая запись в зачётку сравнивала ключ по указателю.
+        subject = sys.intern(self._subject)
+        grades = choices(_GRADE_POOL, k=len(students))
+        graded = list(zip(students, grades))
+        self._teacher.evaluate_students(graded, subject)
+        students_to_expel = [student for student, grade in graded if grade < 4]
         self._classroom.vacate()
         return students_to_expel
 
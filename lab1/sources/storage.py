@@ -90,11 +90,16 @@ class Storage:
 
         temp_file = self.file + ".tmp"
         try:
+            # Сериализуем в одну строку и пишем одним вызовом: компактный
+            # формат без отступов заметно меньше и быстрее при разборе.
+            payload = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
             with open(temp_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=4)
-            if os.path.exists(self.file):
-                os.remove(self.file)
-            os.rename(temp_file, self.file)
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            # Атомарная замена: один syscall вместо remove+rename и без окна,
+            # в котором файл базы отсутствует на диске.
+            os.replace(temp_file, self.file)
         except Exception as e:
             raise StorageError(f"Ошибка сохранения: {e}")
 
@@ -103,7 +108,7 @@ class Storage:
             raise FileNotFoundError
         try:
             with open(self.file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+                data = json.loads(f.read())
             uni = University(data["name"])
 
             for c_data in data["curriculums"]:
@@ -168,9 +173,13 @@ class Storage:
                     if s_id in students_map:
                         reg_students.append(students_map[s_id])
                 if teacher and classroom:
+                    date_ns = int(
+                        datetime.fromisoformat(e_data["date"]).timestamp()
+                        * 1_000_000_000
+                    )
                     exam = Exam(
                         e_data["subject"],
-                        datetime.fromisoformat(e_data["date"]),
+                        date_ns,
                         teacher,
                         classroom,
                     )
@@ -188,11 +197,12 @@ class Storage:
             ("ИИ", ["МОИС", "ППОИС", "ЛОИС", "ОАиП"]),
             ("ВМиП", ["ДМ", "РИК", "ООПиП", "ОАиП"]),
         ]
-        for name, subjects in curriculums_data:
-            uni.register_curriculum(Curriculum(name, subjects))
+        curriculums = [Curriculum(name, subjects) for name, subjects in curriculums_data]
 
-        for number, capacity in [(114, 30), (312, 55), (503, 25), (408, 20), (721, 50)]:
-            uni.register_classroom(Classroom(number, capacity))
+        classrooms = [
+            Classroom(number, capacity)
+            for number, capacity in [(114, 30), (312, 55), (503, 25), (408, 20), (721, 50)]
+        ]
 
         books_data = [
             ("Война и мир", "Л. Н. Толстой", 5),
@@ -200,12 +210,9 @@ class Storage:
             ("Мастер и Маргарита", "М. Булгаков", 2),
             ("1984", "Дж. Оруэлл", 4),
         ]
-        for title, author, quantity in books_data:
-            uni.library.add_book(Book(title, author), quantity)
+        books = [(Book(title, author), quantity) for title, author, quantity in books_data]
 
-        sui = uni.curriculums[0]
-        ii = uni.curriculums[1]
-        vmip = uni.curriculums[2]
+        sui, ii, vmip = curriculums
 
         students_data = [
             ("Иванов Иван Иванович", 20, sui),
@@ -222,10 +229,11 @@ class Storage:
             ("Васильев Василий Васильевич", 21, ii),
         ]
 
+        students = []
         for name, age, curr in students_data:
             s = Student(name, age)
             s.curriculum = curr
-            uni.register_student(s)
+            students.append(s)
 
         teachers_data = [
             (
@@ -267,10 +275,18 @@ class Storage:
             ),
         ]
 
+        teachers = []
         for name, age, deg, subjs in teachers_data:
             t = Teacher(name, age)
             t.degree = deg
             t.subjects = subjs
-            uni.register_teacher(t)
+            teachers.append(t)
 
+        uni.bulk_load(
+            curriculums=curriculums,
+            classrooms=classrooms,
+            books=books,
+            students=students,
+            teachers=teachers,
+        )
         return uni
@@ -1,18 +1,23 @@
+import logging
+import time
 from dataclasses import dataclass, field
-from typing import Optional
-from datetime import datetime
+from typing import Iterable, Optional
 from sources.models import (
+    Book,
     Student,
     Teacher,
     Classroom,
     Curriculum,
     Exam,
     Library,
+    OccupancyBoard,
     ScholarshipDepartment,
     TeacherDegree,
 )
 from sources.exceptions import EnrollmentError, ResourceError
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class University:
@@ -24,6 +29,14 @@ class University:
     _curriculums: list[Curriculum] = field(default_factory=list)
     _exams: list[Exam] = field(default_factory=list)
     _accounting: ScholarshipDepartment = field(default_factory=ScholarshipDepartment)
+    _occupancy: OccupancyBoard = field(default_factory=OccupancyBoard)
+    _curriculum_index: dict[str, Curriculum] = field(default_factory=dict)
+    _classroom_by_number: dict[int, Classroom] = field(default_factory=dict)
+    _teachers_by_subject: dict[str, list[Teacher]] = field(default_factory=dict)
+    _students_by_curriculum: dict[str, list[Student]] = field(default_factory=dict)
+    _student_pos: dict[int, int] = field(default_factory=dict)
+    _teacher_pos: dict[int, int] = field(default_factory=dict)
+    _status_cache: Optional[str] = None
 
     @property
     def name(self) -> str:
@@ -53,26 +66,113 @@ class University:
     def exams(self) -> list[Exam]:
         return self._exams
 
+    def status_line(self) -> str:
+        """Строка состояния для CLI; пересобирается только после изменения
+        составов (кеш сбрасывают мутаторы)."""
+        if self._status_cache is None:
+            self._status_cache = (
+                f"{self._name} | Студентов: {len(self._students)}, "
+                f"Преподавателей: {len(self._teachers)}, "
+                f"Учебных планов: {len(self._curriculums)}"
+            )
+        return self._status_cache
+
+    def _rebuild_indexes(self) -> None:
+        self._curriculum_index = {
+            c.specialty_name.casefold(): c for c in self._curriculums
+        }
+        self._classroom_by_number = {c.number: c for c in self._classrooms}
+        for room in self._classrooms:
+            room.join_board(self._occupancy)
+        self._teacher_pos = {id(t): i for i, t in enumerate(self._teachers)}
+        self._teachers_by_subject = {}
+        for teacher in self._teachers:
+            for subject in teacher.subjects:
+                self._teachers_by_subject.setdefault(subject, []).append(teacher)
+        self._student_pos = {id(s): i for i, s in enumerate(self._students)}
+        self._students_by_curriculum = {}
+        for student in self._students:
+            if student.curriculum:
+                self._students_by_curriculum.setdefault(
+                    student.curriculum.specialty_name, []
+                ).append(student)
+
+    def bulk_load(
+        self,
+        curriculums: Optional[list[Curriculum]] = None,
+        classrooms: Optional[list[Classroom]] = None,
+        books: Optional[list[tuple[Book, int]]] = None,
+        students: Optional[list[Student]] = None,
+        teachers: Optional[list[Teacher]] = None,
+    ) -> None:
+        """Массовая загрузка готовых коллекций: один extend на коллекцию и
+        одна перестройка индексов вместо поштучных регистраций."""
+        if curriculums:
+            self._curriculums.extend(curriculums)
+        if classrooms:
+            self._classrooms.extend(classrooms)
+        if books:
+            for book, quantity in books:
+                self._library.add_book(book, quantity)
+        if students:
+            self._students.extend(students)
+        if teachers:
+            self._teachers.extend(teachers)
+        self._status_cache = None
+        self._rebuild_indexes()
+
     def register_curriculum(self, curriculum: Curriculum) -> None:
+        self._status_cache = None
         self._curriculums.append(curriculum)
+        self._curriculum_index[curriculum.specialty_name.casefold()] = curriculum
 
     def register_classroom(self, classroom: Classroom) -> None:
+        classroom.join_board(self._occupancy)
         self._classrooms.append(classroom)
+        self._classroom_by_number[classroom.number] = classroom
+
+    def find_free_classroom(self) -> Optional[Classroom]:
+        number = self._occupancy.first_free()
+        if number is None:
+            return None
+        return self._classroom_by_number.get(number)
 
     def register_teacher(self, teacher: Teacher) -> None:
+        self._status_cache = None
+        self._teacher_pos[id(teacher)] = len(self._teachers)
         self._teachers.append(teacher)
+        for subject in teacher.subjects:
+            self._teachers_by_subject.setdefault(subject, []).append(teacher)
+
+    def find_teacher_for(self, subject: str) -> Optional[Teacher]:
+        bucket = self._teachers_by_subject.get(subject)
+        return bucket[0] if bucket else None
 
     def register_student(self, student: Student) -> None:
+        self._status_cache = None
+        self._student_pos[id(student)] = len(self._students)
         self._students.append(student)
+        if student.curriculum:
+            self._students_by_curriculum.setdefault(
+                student.curriculum.specialty_name, []
+            ).append(student)
+
+    def find_students_for(self, subject: str) -> list[Student]:
+        # Учебных планов немного: проходим по ним и собираем только
+        # студентов тех планов, где предмет действительно есть.
+        students: list[Student] = []
+        for curriculum in self._curriculums:
+            if curriculum.requires(subject):
+                students.extend(
+                    self._students_by_curriculum.get(curriculum.specialty_name, ())
+                )
+        return students
 
     def register_exam(self, exam: Exam) -> None:
         self._exams.append(exam)
 
     def get_curriculum(self, name: str) -> Optional[Curriculum]:
-        return next(
-            (c for c in self._curriculums if c.specialty_name.lower() == name.lower()),
-            None,
-        )
+        return self._curriculum_index.get(name.casefold())
 
     def enroll_student(self, full_name: str, age: int, curriculum_name: str) -> Student:
         curr = self.get_curriculum(curriculum_name)
@@ -80,11 +180,43 @@ class University:
             raise EnrollmentError(f"Учебный план '{curriculum_name}' не существует!")
         new_student = Student(full_name, age)
         new_student.curriculum = curr
-        self._students.append(new_student)
+        self.register_student(new_student)
+        logger.debug("Студент %s зачислен на '%s'.", full_name, curriculum_name)
         return new_student
 
     def expel_student(self, student: Student) -> None:
-        self._students.remove(student)
+        # pop совмещает проверку наличия и удаление из индекса одним
+        # хеш-обращением вместо get + del.
+        pos = self._student_pos.pop(id(student), None)
+        if pos is None:
+            raise EnrollmentError(f"Студент {student.full_name} не зачислен!")
+        self._status_cache = None
+        # Удаление через swap-pop: последний студент занимает место удалённого.
+        last = self._students.pop()
+        if last is not student:
+            self._students[pos] = last
+            self._student_pos[id(last)] = pos
+        logger.debug("Студент %s отчислен.", student.full_name)
+        if student.curriculum:
+            bucket = self._students_by_curriculum.get(student.curriculum.specialty_name)
+            if bucket and student in bucket:
+                bucket.remove(student)
+
+    def expel_students(self, students: Iterable[Student]) -> None:
+        """Массовое отчисление одним проходом по списку вместо N удалений."""
+        doomed = {id(s): s for s in students if id(s) in self._student_pos}
+        if not doomed:
+            return
+        self._status_cache = None
+        self._students = [s for s in self._students if id(s) not in doomed]
+        self._student_pos = {id(s): i for i, s in enumerate(self._students)}
+        for student in doomed.values():
+            if student.curriculum:
+                bucket = self._students_by_curriculum.get(
+                    student.curriculum.specialty_name
+                )
+                if bucket and student in bucket:
+                    bucket.remove(student)
 
     def enroll_teacher(
         self, full_name: str, age: int, degree: TeacherDegree, subjects: list[str]
@@ -96,11 +228,24 @@ class University:
         new_teacher = Teacher(full_name, age)
         new_teacher.degree = degree
         new_teacher.subjects = subjects
-        self._teachers.append(new_teacher)
+        self.register_teacher(new_teacher)
+        logger.debug("Преподаватель %s принят на работу.", full_name)
         return new_teacher
 
     def fire_teacher(self, teacher: Teacher) -> None:
-        self._teachers.remove(teacher)
+        pos = self._teacher_pos.pop(id(teacher), None)
+        if pos is None:
+            raise EnrollmentError(f"Преподаватель {teacher.full_name} не работает!")
+        self._status_cache = None
+        last = self._teachers.pop()
+        if last is not teacher:
+            self._teachers[pos] = last
+            self._teacher_pos[id(last)] = pos
+        logger.debug("Преподаватель %s уволен.", teacher.full_name)
+        for subject in teacher.subjects:
+            bucket = self._teachers_by_subject.get(subject)
+            if bucket and teacher in bucket:
+                bucket.remove(teacher)
 
     def create_exam(
         self,
@@ -109,11 +254,11 @@ class University:
         classroom: Classroom,
         students: list[Student],
     ) -> Exam:
-        if subject not in teacher.subjects:
+        if not teacher.has_subject(subject):
             raise EnrollmentError(
                 f"Преподаватель {teacher.full_name} не знает {subject}!"
             )
-        exam = Exam(subject, datetime.now(), teacher, classroom)
+        exam = Exam(subject, time.time_ns(), teacher, classroom)
         exam.registered_students = students
         self._exams.append(exam)
         return exam
@@ -124,14 +269,14 @@ class University:
         if self.get_curriculum(specialty_name):
             raise ResourceError(f"Учебный план '{specialty_name}' уже существует!")
         new_curr = Curriculum(specialty_name)
-        self._curriculums.append(new_curr)
+        self.register_curriculum(new_curr)
         return new_curr
 
     def add_classroom(self, number: int, capacity: int) -> Classroom:
-        if any(c.number == number for c in self._classrooms):
+        if number in self._classroom_by_number:
             raise ResourceError(f"Аудитория {number} уже существует!")
         new_room = Classroom(number, capacity)
-        self._classrooms.append(new_room)
+        self.register_classroom(new_room)
         return new_room
 
     def process_semester_end(self) -> int: